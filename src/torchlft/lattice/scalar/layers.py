@@ -8,7 +8,6 @@ from torchlft.nflow.layer import Layer
 from torchlft.nflow.nn import permuted_conv2d
 from torchlft.nflow.partition import Checkerboard2d
 from torchlft.nflow.transforms.core import UnivariateTransformModule
-from torchlft.utils.linalg import mv
 from torchlft.utils.lattice import checkerboard_mask
 
 
@@ -40,9 +39,9 @@ class DiagonalLinearLayer(Layer):
 
     def forward(self, z: Tensor) -> tuple[Tensor, Tensor]:
         assert z.dim() == 2
-        D = self.get_weight()
-        φ = mv(D, z)
-        log_det_dφdz = D.diag().log().sum().expand(φ.shape[0], 1)
+        diag = torch.nn.functional.softplus(self.weight, beta=log(2))
+        φ = diag * z  # diagonal matvec is just an elementwise product
+        log_det_dφdz = diag.log().sum().expand(φ.shape[0], 1)
         return φ, log_det_dφdz
 
 
@@ -59,15 +58,21 @@ class TriangularLinearLayer(Layer):
         self.register_parameter("tril", nn.Parameter(tril))
         self.register_buffer("mask", mask)
 
+    def get_diag(self) -> Tensor:
+        return torch.nn.functional.softplus(self.diag, beta=log(2))
+
     def get_weight(self) -> Tensor:
-        diag = torch.nn.functional.softplus(self.diag, beta=log(2))
-        return torch.diag_embed(diag).masked_scatter(self.mask, self.tril)
+        return torch.diag_embed(self.get_diag()).masked_scatter(
+            self.mask, self.tril
+        )
 
     def forward(self, z: Tensor) -> tuple[Tensor, Tensor]:
         assert z.dim() == 2
-        L = self.get_weight()
-        φ = mv(L, z)
-        log_det_dφdz = L.diag().log().sum().expand(φ.shape[0], 1)
+        diag = self.get_diag()
+        L = torch.diag_embed(diag).masked_scatter(self.mask, self.tril)
+        φ = torch.nn.functional.linear(z, L)
+        # Log-det from the softplus'd diagonal shared with the weight
+        log_det_dφdz = diag.log().sum().expand(φ.shape[0], 1)
         return φ, log_det_dφdz
 
 
@@ -1,17 +1,56 @@
 import torch
 
-from torchlft.scalar.action import ActionV1, ActionV2
+from torchlft.lattice.scalar.action import GaussianAction, ActionV2
 
 
 def test_actions_agree():
-    d = 2
-    L = 6
-    m_sq = 1.5
+    for d, L in [(1, 8), (2, 6)]:
+        m_sq = 1.5
 
-    φ = torch.empty(1000, L, L, 1).normal_()
+        φ = torch.empty(1000, *[L for _ in range(d)]).normal_()
 
-    S1 = ActionV1(L, m_sq, d)(φ.flatten(1))
-    S2 = ActionV2(m_sq, d)(φ)
+        target = GaussianAction(L, d, m_sq)
+        S1 = target(φ.flatten(1)) - target.log_norm
+        S2 = ActionV2(m_sq, d)(φ)
 
-    assert S1.shape == S2.shape
-    assert torch.allclose(S1, S2, atol=1e-6)
+        assert S1.shape == S2.shape
+        assert torch.allclose(S1, S2, atol=1e-3)
+
+        dS1 = target.grad(φ.flatten(1))
+        dS2 = ActionV2(m_sq, d).grad(φ)
+
+        assert torch.allclose(dS1, dS2.flatten(1), atol=1e-4)
+
+
+def test_capture_grad_falls_back_on_cpu():
+    action = ActionV2(1.0, 2)
+    φ = torch.empty(10, 4, 4).normal_()
+
+    grad_fn = action.capture_grad(φ)
+
+    assert torch.allclose(grad_fn(φ), action.grad(φ))
+
+
+def test_cholesky_factorization():
+    L, d = 6, 2
+    target = GaussianAction(L, d, 0.5)
+
+    C, Σ, K = target.cholesky, target.covariance, target.kernel
+
+    assert torch.allclose(C, C.tril())
+    assert torch.all(C.diag() > 0)
+    assert torch.allclose(C @ C.mT, Σ, atol=1e-5)
+    assert torch.allclose(Σ @ K, torch.eye(pow(L, d)), atol=1e-4)
+
+
+def test_stencil_matches_dense_kernel():
+    for d, L in [(1, 8), (2, 6)]:
+        m_sq = 0.5
+
+        dense = GaussianAction(L, d, m_sq, use_stencil=False)
+        stencil = GaussianAction(L, d, m_sq)
+
+        φ = torch.empty(100, pow(L, d)).normal_()
+
+        assert torch.allclose(stencil(φ), dense(φ), atol=1e-3)
+        assert torch.allclose(stencil.grad(φ), dense.grad(φ), atol=1e-4)
@@ -80,13 +80,19 @@ class GaussianModel(BaseModel):
         super().__init__()
 
         self.register_module("target", target.build())
+        self.register_buffer("_z_buffer", torch.empty(0), persistent=False)
 
     def sample_base(self, batch_size: PositiveInt) -> tuple[Tensor, Tensor]:
         D = self.target.lattice_size
 
-        z = torch.empty(
-            size=(batch_size, D), device=self.device, dtype=self.dtype
-        ).normal_()
+        # Refill a preallocated buffer instead of allocating a fresh
+        # tensor every batch. The buffer is overwritten on the next
+        # call, so callers must not hold onto z across batches.
+        if self._z_buffer.shape != (batch_size, D):
+            self._z_buffer = torch.empty(
+                size=(batch_size, D), device=self.device, dtype=self.dtype
+            )
+        z = torch.randn(batch_size, D, out=self._z_buffer)
 
         S = 0.5 * dot(z, z)
         log_norm = 0.5 * D * log(2 * π)
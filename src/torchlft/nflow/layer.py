@@ -22,7 +22,9 @@ class Composition(Layer):
     def __iter__(self):
         return iter(self.layers)
 
-    def forward(self, inputs: Tensor | tuple[Tensor, ...]):
+    def forward(
+        self, inputs: Tensor | tuple[Tensor, ...]
+    ) -> tuple[Tensor | tuple[Tensor, ...], Tensor]:
         ldj_total = 0.0
 
         for layer in self:
@@ -9,12 +9,23 @@ Tensor = torch.Tensor
 
 def _affine_forward(x: Tensor, params: Tensor) -> tuple[Tensor, Tensor]:
     s, t = params.split(1, dim=-1)
-    return x * s + t, s
+    # addcmul fuses the multiply-add into one kernel and one allocation
+    return torch.addcmul(t, x, s), s
+
+
+def _shift_forward(x: Tensor, t: Tensor) -> tuple[Tensor, Tensor]:
+    # Unit gradient: a (batch, 1) ones broadcasts through the log-sum,
+    # so no full-size gradient tensor is allocated
+    return x + t, x.new_ones(x.shape[0], 1)
+
+
+def _rescale_forward(x: Tensor, s: Tensor) -> tuple[Tensor, Tensor]:
+    return x * s, s
 
 
 def _affine_inverse(y: Tensor, params: Tensor) -> tuple[Tensor, Tensor]:
     s, t = params.split(1, dim=-1)
-    s_inv = 1 / s
+    s_inv = s.reciprocal()
     return (y - t) * s_inv, s_inv
 
 
@@ -28,9 +39,10 @@ def affine_transform(
 
     if shift_only:
         n_params = 1
+        transform_fn = _shift_forward
 
         def handle_params(params: Tensor) -> Tensor:
-            return torch.cat([torch.ones_like(params), params], dim=-1)
+            return params
 
     else:
         if scale_fn == "exponential":
@@ -49,24 +61,25 @@ def affine_transform(
 
         if rescale_only:
             n_params = 1
+            transform_fn = _rescale_forward
 
             def handle_params(params: Tensor) -> Tensor:
-                return torch.cat(
-                    [scale_fn(params), torch.zeros_like(params)], dim=-1
-                )
+                return scale_fn(params)
 
         else:
             n_params = 2
+            transform_fn = _affine_forward
 
             def handle_params(params: Tensor) -> Tensor:
                 s, t = params.split(1, dim=-1)
                 return torch.cat([scale_fn(s), t], dim=-1)
 
     _n_params = n_params
+    _transform_fn = transform_fn
 
     class AffineTransform(Transform):
         n_params = _n_params
         handle_params_fn = staticmethod(handle_params)
-        transform_fn = staticmethod(_affine_forward)
+        transform_fn = staticmethod(_transform_fn)
 
     return AffineTransform
@@ -10,10 +10,11 @@ Tensor: TypeAlias = torch.Tensor
 
 class Transform:
     n_params: ClassVar[int]
-    handle_params_fn: ClassVar[Callable[Tensor, Tensor]]
-    transform_fn: ClassVar[
-        Callable[[Tensor, Tensor, Any, ...], tuple[Tensor, Tensor]]
+    # The spline transforms return a tuple of parameter tensors
+    handle_params_fn: ClassVar[
+        Callable[[Tensor], Tensor | tuple[Tensor, ...]]
     ]
+    transform_fn: ClassVar[Callable[..., tuple[Tensor, Tensor]]]
 
     def __init__(self, params: Tensor, **context):
         self.params = self.handle_params_fn(params)
@@ -25,7 +26,7 @@ class Transform:
 
 # TODO: inverse?
 
-Wrapper: TypeAlias = Callable[Transform, Transform]
+Wrapper: TypeAlias = Callable[[Transform], Transform]
 
 
 def hook_from_wrapper(wrapper):
@@ -44,7 +45,7 @@ class UnivariateTransformModule(TransformModule):
     def __init__(
         self,
         transform_cls: type[Transform],
-        context_fn: Callable[Tensor, Tensor],
+        context_fn: Callable[[Tensor], Tensor],
         wrappers: list[Wrapper] = [],
     ):
         super().__init__()
@@ -74,7 +75,7 @@ def _autoregressive_bivariate_transform(
         def __init__(self, context: Tensor):
             self.context = context
 
-        def __call__(self, x: Tensor):
+        def __call__(self, x: Tensor) -> tuple[Tensor, Tensor]:
             assert x.shape[-1] == 2
             x_a, x_b = x.split(1, dim=-1)
 
@@ -97,7 +98,7 @@ class BivariateTransformModule(TransformModule):
         self,
         univariate_a: UnivariateTransformModule,
         univariate_b: UnivariateTransformModule,
-        context_fn: Callable[Tensor, Tensor] | None,
+        context_fn: Callable[[Tensor], Tensor] | None,
         wrappers: list[Wrapper] = [],
     ):
         super().__init__()
@@ -0,0 +1,64 @@
+import torch
+
+from torchlft.nflow.transforms.spline import rq_spline_transform
+
+
+def test_rq_spline_round_trip():
+    n_segments = 8
+    bounds = (-2.0, 2.0)
+
+    forward_cls = rq_spline_transform(n_segments, *bounds)
+    inverse_cls = rq_spline_transform(n_segments, *bounds, inverse=True)
+
+    params = torch.empty(1000, 3 * n_segments - 1, dtype=torch.double)
+    params.normal_()
+    x = torch.empty(1000, 1, dtype=torch.double).uniform_(*bounds)
+
+    y, dydx = forward_cls(params)(x)
+    z, dxdy = inverse_cls(params)(y)
+
+    assert y.shape == x.shape
+    assert torch.all(y > bounds[0]) and torch.all(y < bounds[1])
+    assert torch.all(dydx > 0)
+
+    assert torch.allclose(z, x, atol=1e-10)
+    assert torch.allclose(dydx * dxdy, torch.ones_like(dydx), atol=1e-10)
+
+
+def test_rq_spline_sum_ldj():
+    n_segments = 8
+    bounds = (-2.0, 2.0)
+
+    grad_cls = rq_spline_transform(n_segments, *bounds)
+    ldj_cls = rq_spline_transform(n_segments, *bounds, sum_ldj=True)
+    ldj_inv_cls = rq_spline_transform(
+        n_segments, *bounds, inverse=True, sum_ldj=True
+    )
+
+    params = torch.empty(100, 4, 3 * n_segments - 1, dtype=torch.double)
+    params.normal_()
+    x = torch.empty(100, 4, 1, dtype=torch.double).uniform_(*bounds)
+
+    y, gradient = grad_cls(params)(x)
+    y_ldj, ldj = ldj_cls(params)(x)
+    _, ldj_inv = ldj_inv_cls(params)(y)
+
+    assert torch.allclose(y_ldj, y)
+    assert ldj.shape == (100, 1)
+    assert torch.allclose(
+        ldj, gradient.log().flatten(1).sum(1, keepdim=True), atol=1e-10
+    )
+    assert torch.allclose(ldj + ldj_inv, torch.zeros_like(ldj), atol=1e-10)
+
+
+def test_rq_spline_gradient_matches_autograd():
+    n_segments = 4
+    transform_cls = rq_spline_transform(n_segments, -1.0, 1.0)
+
+    params = torch.empty(100, 3 * n_segments - 1).normal_()
+    x = torch.empty(100, 1).uniform_(-1, 1).requires_grad_()
+
+    y, gradient = transform_cls(params)(x)
+    (autograd_gradient,) = torch.autograd.grad(y.sum(), x)
+
+    assert torch.allclose(gradient, autograd_gradient, atol=1e-6)
@@ -1,17 +1,19 @@
 from math import pi as π
-from typing import Any, Callable, TypeAlias
+from typing import Callable, TypeAlias
 
 import torch
 
 from torchlft.utils.torch import mod_2pi
 
 Tensor: TypeAlias = torch.Tensor
-Transform: TypeAlias = Callable[[Tensor, Any, ...], tuple[Tensor, Tensor]]
-Wrapper: TypeAlias = Callable[Transform, Transform]
+Transform: TypeAlias = Callable[..., tuple[Tensor, Tensor]]
+Wrapper: TypeAlias = Callable[[Transform], Transform]
 
 
 def complex_to_arg(transform):
-    def wrapped_transform(x: Tensor, *args, **kwargs):
+    def wrapped_transform(
+        x: Tensor, *args, **kwargs
+    ) -> tuple[Tensor, Tensor]:
         r, θ = x.abs(), mod_2pi(x.angle())
         # NOTE: should I demand r == 1 here to be safe??
         ψ, grad_or_ldj = transform(θ, *args, **kwargs)
@@ -22,14 +24,18 @@ def complex_to_arg(transform):
 
 
 def unit_vector_to_angle(transform):
-    def wrapped_transform(x: Tensor, *args, **kwargs):
+    def wrapped_transform(
+        x: Tensor, *args, **kwargs
+    ) -> tuple[Tensor, Tensor]:
         raise NotImplementedError
 
     return wrapped_transform
 
 
 def complex_to_vector(transform):
-    def wrapped_transform(x: Tensor, *args, **kwargs):
+    def wrapped_transform(
+        x: Tensor, *args, **kwargs
+    ) -> tuple[Tensor, Tensor]:
         assert x.shape[-1] == 1
         x_2d = torch.cat([x.real, x.imag], dim=-1)
         y_2d, grad_or_ldj = transform(x_2d, *args, **kwargs)
@@ -41,7 +47,9 @@ def complex_to_vector(transform):
 
 
 def complex_to_polar(transform):
-    def wrapped_transform(x: Tensor, *args, **kwargs):
+    def wrapped_transform(
+        x: Tensor, *args, **kwargs
+    ) -> tuple[Tensor, Tensor]:
         assert x.shape[-1] == 1
         rθ = torch.cat([x.abs(), mod_2pi(x.angle())], dim=-1)
         ρφ, grad_or_ldj = transform(rθ)
@@ -58,14 +66,18 @@ def complex_to_polar(transform):
 
 
 def vector_to_polar(transform):
-    def wrapped_transform(x: Tensor, *args, **kwargs):
+    def wrapped_transform(
+        x: Tensor, *args, **kwargs
+    ) -> tuple[Tensor, Tensor]:
         raise NotImplementedError
 
     return wrapped_transform
 
 
 def pi_rotation(transform):
-    def wrapped_transform(θ: Tensor, *args, **kwargs):
+    def wrapped_transform(
+        θ: Tensor, *args, **kwargs
+    ) -> tuple[Tensor, Tensor]:
         θ, grad_or_ldj = transform(mod_2pi(θ + π))
         return mod_2pi(θ - π), grad_or_ldj
 
@@ -81,9 +93,15 @@ def mask_outside_interval(
 ):
     assert lower_bound < upper_bound
 
-    def wrapped_transform(x: Tensor, *args, **kwargs):
+    def wrapped_transform(
+        x: Tensor, *args, **kwargs
+    ) -> tuple[Tensor, Tensor]:
         inside_bounds = (x > lower_bound + tol) & (x < upper_bound - tol)
 
+        if inside_bounds.all():
+            # Common case: skip the clamp and both write-back selects
+            return transform(x, *args, **kwargs)
+
         y, grad = transform(
             x.clamp(lower_bound + tol, upper_bound - tol), *args, **kwargs
         )
@@ -97,8 +115,34 @@ def mask_outside_interval(
     return wrapped_transform
 
 
+def mixed_precision(transform):
+    def wrapped_transform(
+        x: Tensor, *args, **kwargs
+    ) -> tuple[Tensor, Tensor]:
+        # Run the pointwise arithmetic in bfloat16; keep the gradient
+        # (and hence the log-det accumulation) in full precision
+        params = getattr(transform, "params", None)
+        if isinstance(params, Tensor):
+            transform.params = params.to(torch.bfloat16)
+        elif isinstance(params, tuple):
+            transform.params = tuple(
+                p.to(torch.bfloat16) for p in params
+            )
+
+        with torch.autocast(x.device.type, dtype=torch.bfloat16):
+            y, grad_or_ldj = transform(
+                x.to(torch.bfloat16), *args, **kwargs
+            )
+
+        return y.to(x.dtype), grad_or_ldj.to(torch.float32)
+
+    return wrapped_transform
+
+
 def sum_log_gradient(transform):
-    def wrapped_transform(x: Tensor, *args, **kwargs):
+    def wrapped_transform(
+        x: Tensor, *args, **kwargs
+    ) -> tuple[Tensor, Tensor]:
         y, grad = transform(x, *args, **kwargs)
         sum_log_grad = grad.log().flatten(start_dim=1).sum(dim=1, keepdim=True)
         return y, sum_log_grad
@@ -1,3 +1,4 @@
+from functools import cache
 from typing import TypeAlias
 
 import torch
@@ -66,6 +67,7 @@ def dilated_checkerboard_mask(
     return checker
 
 
+@cache
 def laplacian(lattice_length: int, lattice_dim: int) -> Tensor:
     """
     Creates a Laplacian matrix.
@@ -74,6 +76,9 @@ def laplacian(lattice_length: int, lattice_dim: int) -> Tensor:
     Laplacian matrix with the identity.
 
     Assumes a square, periodic lattice.
+
+    The result is cached and shared between callers, who must not
+    modify it in place.
     """
     assert lattice_dim in (1, 2)
 
@@ -17,6 +17,10 @@ def cross(x: Tensor, y: Tensor) -> Tensor:
     return torch.linalg.cross(x, y, dim=-1)
 
 
+def triple_product(x: Tensor, y: Tensor, z: Tensor) -> Tensor:
+    return dot(x, cross(y, z))
+
+
 def mv(M: Tensor, v: Tensor) -> Tensor:
     return torch.einsum("...ij,...j->...i", M, v)
 
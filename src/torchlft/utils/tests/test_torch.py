@@ -0,0 +1,15 @@
+from math import log
+
+import torch
+
+from torchlft.utils.torch import log_cosh
+
+
+def test_log_cosh():
+    x = torch.linspace(-5, 5, 101)
+    assert torch.allclose(log_cosh(x), x.cosh().log(), atol=1e-6)
+
+    # cosh overflows fp32 for |x| > ~89; the softplus form does not
+    x = torch.tensor([100.0, -100.0])
+    assert torch.isfinite(log_cosh(x)).all()
+    assert torch.allclose(log_cosh(x), x.abs() - log(2))
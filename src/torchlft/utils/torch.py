@@ -12,7 +12,9 @@ def mod_2pi(θ: Tensor) -> Tensor:
 
 def log_cosh(x: Tensor) -> Tensor:
     """Numerically stable implementation of log(cosh(x))"""
-    return abs(x) + torch.log1p(torch.exp(-1 * abs(x))) - log(2)
+    # log(cosh(x)) = |x| + softplus(-2|x|) - log(2); softplus handles
+    # the exp without overflow
+    return abs(x) + torch.nn.functional.softplus(-2 * abs(x)) - log(2)
 
 
 def sum_except_batch(x: Tensor, keepdim: bool = False) -> Tensor: